@@ -1,46 +1,43 @@
-import csv
+import os
+
+import numpy as np
+import pandas as pd
 
 # Define the path to your CSV file
 csv_file_path = 'Minnesota_Driving_Quiz.csv'
+tmp_file_path = csv_file_path + '.tmp'
+
+option_columns = ['Option A', 'Option B', 'Option C', 'Option D']
+
+# Load the whole bank through the C parser and clean it column-wise.
+# Rows with stray commas (unquoted "$25,000" style values) are reported
+# and skipped so the rest of the bank still gets cleaned.
+df = pd.read_csv(csv_file_path, dtype=str, on_bad_lines='warn')
+df = df[['Question'] + option_columns + ['Correct Answer']]
+
+# Strip the "a) " / "b) " / "c) " / "d) " prefixes from all options at once
+df[option_columns] = df[option_columns].apply(
+    lambda col: col.str.replace(r'^[a-d]\)\s*', '', regex=True).str.strip()
+)
+
+# Resolve prefixed correct answers ("b) ...") to the matching option column
+correct = df['Correct Answer'].str.strip()
+letter = correct.str.extract(r'^([a-d])\) ', expand=False)
+df['Correct Answer'] = np.select(
+    [letter == 'a', letter == 'b', letter == 'c', letter == 'd'],
+    [df['Option A'], df['Option B'], df['Option C'], df['Option D']],
+    default=correct
+)
+
+# Report rows whose correct answer could not be resolved to an option
+matched = df[option_columns].eq(df['Correct Answer'], axis=0).any(axis=1)
+for _, row in df[~matched & df['Correct Answer'].notna()].iterrows():
+    print(f"Error: Correct answer '{row['Correct Answer']}' does not match any option for question: {row['Question']}")
+for question in df.loc[df['Correct Answer'].isna(), 'Question']:
+    print(f"Error: Correct answer is missing for question: {question}")
+
+# Write to a temp file and atomically swap it in
+df.to_csv(tmp_file_path, index=False)
+os.replace(tmp_file_path, csv_file_path)
 
-# Read the CSV file and clean the options and correct answers
-cleaned_rows = []
-with open(csv_file_path, 'r') as file:
-    reader = csv.DictReader(file)
-    for row in reader:
-        # Filter out None keys
-        row = {k: v for k, v in row.items() if k is not None}
-        # Clean the options by removing "a) ", "b) ", "c) ", "d) " prefixes
-        row['Option A'] = row['Option A'].replace('a) ', '').strip()
-        row['Option B'] = row['Option B'].replace('b) ', '').strip()
-        row['Option C'] = row['Option C'].replace('c) ', '').strip()
-        row['Option D'] = row['Option D'].replace('d) ', '').strip()
-        
-        # Ensure the correct answer is in the correct format
-        correct_answer = row.get('Correct Answer')
-        if correct_answer:
-            correct_answer = correct_answer.strip()
-            if correct_answer.startswith('a) '):
-                row['Correct Answer'] = row['Option A']
-            elif correct_answer.startswith('b) '):
-                row['Correct Answer'] = row['Option B']
-            elif correct_answer.startswith('c) '):
-                row['Correct Answer'] = row['Option C']
-            elif correct_answer.startswith('d) '):
-                row['Correct Answer'] = row['Option D']
-            else:
-                # If the correct answer does not match any option, log an error
-                print(f"Error: Correct answer '{correct_answer}' does not match any option for question: {row['Question']}")
-        else:
-            print(f"Error: Correct answer is missing for question: {row['Question']}")
-        
-        cleaned_rows.append(row)
-
-# Write the cleaned rows back to the same CSV file
-with open(csv_file_path, 'w', newline='') as file:
-    fieldnames = ['Question', 'Option A', 'Option B', 'Option C', 'Option D', 'Correct Answer']
-    writer = csv.DictWriter(file, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(cleaned_rows)
-
-print(f"Options and correct answers cleaned and saved to {csv_file_path}.")
\ No newline at end of file
+print(f"Options and correct answers cleaned and saved to {csv_file_path}.")
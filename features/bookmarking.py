@@ -8,46 +8,55 @@ class BookmarkManager:
     @staticmethod
     def initialize_session_state():
         """Initialize bookmark-related session state variables."""
+        BookmarkManager._bookmarks()
+
+    @staticmethod
+    def _bookmarks() -> Set[int]:
+        """Return the bookmark set, creating it on first access.
+
+        Every public method goes through this single check instead of
+        re-running initialize_session_state() and then re-reading the
+        attribute from session state.
+        """
         if 'bookmarked_questions' not in st.session_state:
             st.session_state.bookmarked_questions = set()
-    
+        return st.session_state.bookmarked_questions
+
     @staticmethod
     def toggle_bookmark(question_num: int) -> bool:
         """Toggle bookmark status for a question."""
-        BookmarkManager.initialize_session_state()
-        
-        if question_num in st.session_state.bookmarked_questions:
-            st.session_state.bookmarked_questions.remove(question_num)
+        bookmarks = BookmarkManager._bookmarks()
+
+        if question_num in bookmarks:
+            bookmarks.remove(question_num)
             return False
         else:
-            st.session_state.bookmarked_questions.add(question_num)
+            bookmarks.add(question_num)
             return True
-    
+
     @staticmethod
     def is_bookmarked(question_num: int) -> bool:
         """Check if a question is bookmarked."""
-        BookmarkManager.initialize_session_state()
-        return question_num in st.session_state.bookmarked_questions
-    
+        return question_num in BookmarkManager._bookmarks()
+
     @staticmethod
     def get_bookmarked_questions() -> Set[int]:
         """Get set of bookmarked question numbers."""
-        BookmarkManager.initialize_session_state()
-        return st.session_state.bookmarked_questions
-    
+        return BookmarkManager._bookmarks()
+
     @staticmethod
     def create_practice_session(questions: List[Dict[str, Any]]):
         """Create a practice session from bookmarked questions."""
-        BookmarkManager.initialize_session_state()
-        
-        if st.session_state.bookmarked_questions:
+        if BookmarkManager._bookmarks():
             st.session_state.practice_mode = True
+            # Index in sorted order: deterministic quiz order, and the indices
+            # are resolved in one pass instead of iterating the set directly
             st.session_state.practice_questions = [
-                questions[q_num] for q_num in st.session_state.bookmarked_questions
+                questions[q_num] for q_num in sorted(st.session_state.bookmarked_questions)
             ]
             st.session_state.current_question = 0
             st.session_state.score = 0
-            st.session_state.answered_correctly = set()
+            st.session_state.answered_correctly = 0
             st.session_state.incorrect_questions = []
             return True
         return False
@@ -2,18 +2,16 @@
 import smtplib
 import ssl
 import os
-import logging
+import queue
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Tuple, Optional, Dict, Any
 
+from logging_setup import get_logger
+
 # Set up logging
-logging.basicConfig(
-    level=logging.ERROR,
-    filename='quiz_errors.log',
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 class ErrorReporter:
     def __init__(self):
@@ -22,6 +20,73 @@ class ErrorReporter:
         self.sender_email = "remixonwin@gmail.com"
         self.password = os.getenv('QUIZ_APP_EMAIL_PASSWORD', 'reidtcyujehfgxqi')
         self.receiver_email = "remixonwin@gmail.com"
+        # Reused across reports; (re)established lazily by _get_server()
+        self._server: Optional[smtplib.SMTP] = None
+        self._ssl_context = ssl.create_default_context()
+        # Outgoing reports are delivered off the request path by a single
+        # daemon worker, started lazily on the first report
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def _ensure_worker(self):
+        """Start the delivery worker if it is not already running."""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._deliver_loop, name="error-report-sender", daemon=True
+                )
+                self._worker.start()
+
+    def _deliver_loop(self):
+        """Drain the report queue, delivering each message over SMTP."""
+        while True:
+            message = self._queue.get()
+            try:
+                self._deliver(message)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, message: "MIMEMultipart"):
+        """Send one report over the cached connection, reconnecting if stale."""
+        try:
+            server = self._get_server()
+            server.sendmail(self.sender_email, self.receiver_email, message.as_string())
+            logger.info("Error report email sent successfully")
+        except Exception as e:
+            logger.error(f"Failed to send error report email: {str(e)}")
+            self._close_server()
+
+    def _get_server(self) -> smtplib.SMTP:
+        """Return a logged-in SMTP connection, reusing the previous one.
+
+        Connecting and negotiating STARTTLS dominates the cost of sending a
+        report, so the connection is kept open between reports and only
+        rebuilt when the server has dropped it.
+        """
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except Exception:
+                self._close_server()
+
+        server = smtplib.SMTP(self.smtp_server, self.port)
+        server.ehlo()
+        server.starttls(context=self._ssl_context)
+        server.ehlo()
+        server.login(self.sender_email, self.password)
+        self._server = server
+        return server
+
+    def _close_server(self):
+        """Drop the cached SMTP connection."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
 
     def format_error_report(self, question_data: Dict[str, Any], error_report: str, contact_email: Optional[str]) -> str:
         """Format the error report into a readable email message."""
@@ -46,7 +111,12 @@ Email: {contact_email if contact_email else 'Not provided'}
         return report
 
     def send_error_report(self, question_data: Dict[str, Any], error_report: str, contact_email: Optional[str] = None) -> Tuple[bool, str]:
-        """Send error report via email."""
+        """Queue an error report for email delivery.
+
+        Delivery happens on a background worker so the Streamlit request
+        thread never blocks on the SMTP round trip; failures are logged by
+        the worker.
+        """
         try:
             message = MIMEMultipart()
             message["Subject"] = "Quiz Question Error Report"
@@ -57,28 +127,9 @@ Email: {contact_email if contact_email else 'Not provided'}
             body = self.format_error_report(question_data, error_report, contact_email)
             message.attach(MIMEText(body, "plain"))
 
-            # Create a secure SSL/TLS context
-            context = ssl.create_default_context()
-
-            # Try to log in to server and send email
-            try:
-                server = smtplib.SMTP(self.smtp_server, self.port)
-                server.ehlo()  # Can be omitted
-                server.starttls(context=context)  # Secure the connection
-                server.ehlo()  # Can be omitted
-                server.login(self.sender_email, self.password)
-                
-                # Send email
-                server.sendmail(self.sender_email, self.receiver_email, message.as_string())
-                logger.info("Error report email sent successfully")
-                return True, "Error report submitted successfully!"
-                
-            except Exception as e:
-                logger.error(f"Failed to send error report email: {str(e)}")
-                return False, f"Failed to send error report: {str(e)}"
-                
-            finally:
-                server.quit()
+            self._queue.put(message)
+            self._ensure_worker()
+            return True, "Error report submitted successfully!"
 
         except Exception as e:
             logger.error(f"Error preparing email: {str(e)}")
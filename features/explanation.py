@@ -1,12 +1,13 @@
 """Explanation generation functionality for the quiz application."""
 import re
+from functools import lru_cache
 from typing import Dict, Pattern
 
 class ExplanationGenerator:
     """Generates explanations for quiz questions based on topics."""
     
     def __init__(self):
-        """Initialize explanation templates and patterns."""
+        """Initialize explanation templates and compiled patterns."""
         self.topic_templates: Dict[str, Dict[str, str | Pattern]] = {
             'Licensing': {
                 'pattern': r'(minimum|required|valid|fee)',
@@ -33,18 +34,29 @@ class ExplanationGenerator:
                 'template': "When operating a vehicle, {} is the correct procedure for {}."
             }
         }
-    
+
+        # Compile every topic pattern once at init so generate() never pays
+        # the re.compile/cache lookup on the hot path
+        for template in self.topic_templates.values():
+            template['pattern'] = re.compile(template['pattern'])
+        self._context_pattern = re.compile(r'^what (is|should|must|does)|[?]')
+
+    @lru_cache(maxsize=512)
     def generate(self, question: str, correct_answer: str, topic: str) -> str:
-        """Generate an explanation for the given question and answer."""
+        """Generate an explanation for the given question and answer.
+
+        Results are memoized on (question, correct_answer, topic) since the
+        same questions are re-rendered across reruns and sessions.
+        """
         # Clean up the question and answer
         q_lower = question.lower()
         
         # Try to match topic-specific patterns
         if topic in self.topic_templates:
             pattern = self.topic_templates[topic]['pattern']
-            if re.search(pattern, q_lower):
+            if pattern.search(q_lower):
                 # Extract relevant parts of the question
-                context = re.sub(r'^what (is|should|must|does)|[?]', '', q_lower).strip()
+                context = self._context_pattern.sub('', q_lower).strip()
                 return self.topic_templates[topic]['template'].format(correct_answer, context)
         
         # Default explanation if no pattern matches
@@ -1,4 +1,6 @@
 """Topic categorization functionality for the quiz application."""
+import re
+from functools import lru_cache
 from typing import Dict, List
 
 class TopicCategorizer:
@@ -40,17 +42,38 @@ class TopicCategorizer:
                 'steering', 'brake', 'accelerate'
             ]
         }
-    
+
+        # Fold every keyword into one automaton-style alternation with a
+        # named group per topic, so categorize() makes a single scan over the
+        # question instead of one pass per topic. Declaration order still
+        # decides which topic wins when several match.
+        self._combined_pattern = re.compile(
+            '|'.join(
+                '(?P<t{}>{})'.format(i, '|'.join(re.escape(keyword) for keyword in keywords))
+                for i, keywords in enumerate(self.topics.values())
+            ),
+            re.IGNORECASE
+        )
+        self._group_topics = {f't{i}': topic for i, topic in enumerate(self.topics)}
+        self._topic_rank = {topic: i for i, topic in enumerate(self.topics)}
+
+    @lru_cache(maxsize=512)
     def categorize(self, question: str) -> str:
-        """Categorize a question based on its content."""
-        question_lower = question.lower()
-        
-        # Check each topic's keywords
-        for topic, keywords in self.topics.items():
-            if any(keyword.lower() in question_lower for keyword in keywords):
-                return topic
-        
-        return "General Knowledge"
+        """Categorize a question based on its content.
+
+        Memoized per question text: the same bank is categorized again on
+        every quiz restart.
+        """
+        best = None
+        for match in self._combined_pattern.finditer(question):
+            topic = self._group_topics[match.lastgroup]
+            rank = self._topic_rank[topic]
+            if best is None or rank < best[0]:
+                best = (rank, topic)
+                if rank == 0:
+                    break
+
+        return best[1] if best else "General Knowledge"
     
     def get_topics(self) -> List[str]:
         """Get list of all available topics."""
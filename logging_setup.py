@@ -0,0 +1,26 @@
+"""Shared logging configuration for the quiz application."""
+import logging
+
+_configured = False
+
+def setup_logging() -> None:
+    """Configure the quiz_errors.log root handler exactly once per process.
+
+    The module-level sentinel makes repeat calls a plain boolean check, so
+    every module can call this at import time without taking the logging
+    lock or re-checking the root handlers.
+    """
+    global _configured
+    if not _configured:
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.ERROR,
+                filename='quiz_errors.log',
+                format='%(asctime)s - %(levelname)s - %(message)s'
+            )
+        _configured = True
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a module logger backed by the shared configuration."""
+    setup_logging()
+    return logging.getLogger(name)
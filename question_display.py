@@ -1,71 +1,94 @@
 """Question display and interaction handling."""
 import streamlit as st
-import random
-import logging
-from typing import List, Tuple, Optional
+from typing import List, Tuple
+
+from logging_setup import get_logger
+from quiz_utils import get_session_rng, get_report_logger
 
 # Set up logging to file
-logging.basicConfig(
-    level=logging.ERROR,
-    filename='quiz_errors.log',
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Fallback shown when a question has unusable data; built once at import
+DEFAULT_OPTIONS = ("Option A", "Option B", "Option C", "Option D")
+DEFAULT_CORRECT = "Option A"
+
+# Frozen at module scope; issubset is a single C-level containment test
+_REQUIRED_FIELDS = frozenset(('question', 'options', 'correct_answer'))
+
+def randomize_options(options: List[str]) -> List[str]:
+    """Return the options in random order.
+
+    random.sample runs the Fisher-Yates selection internally, so this
+    needs no auxiliary index list or pairing allocations.
+    """
+    return get_session_rng().sample(options, len(options))
+
+def get_question_state(question_num: int) -> dict:
+    """Return the namespaced state dict for one question.
+
+    All per-question state (shuffled options, answered flag, the user's
+    answer) lives in a single st.session_state.q_state list parallel to
+    the questions, so access is a plain integer index instead of a
+    formatted options_N/correct_N/answered_N flat key. The list grows on
+    demand when options were not batch-prepared up front.
+    """
+    if 'q_state' not in st.session_state:
+        st.session_state.q_state = []
+    q_state = st.session_state.q_state
+    while len(q_state) <= question_num:
+        q_state.append({})
+    return q_state[question_num]
+
+def _store_options(q_state: dict, options: List[str], correct_answer: str) -> Tuple[List[str], str]:
+    """Write a question's options into its state dict exactly once."""
+    q_state['options'] = options
+    q_state['correct'] = correct_answer
+    return options, correct_answer
 
 def get_question_options(current_q: dict, question_num: int) -> Tuple[List[str], str]:
     """Get or create randomized options for a question."""
-    options_key = f"options_{question_num}"
-    correct_key = f"correct_{question_num}"
-    
+    q_state = get_question_state(question_num)
+
     # If options are already stored in session state, use them
-    if options_key in st.session_state and correct_key in st.session_state:
-        return st.session_state[options_key], st.session_state[correct_key]
-    
-    # Otherwise, create new randomized options
-    try:
-        options = current_q['options']
-        correct_answer = current_q['correct_answer']
-        
-        # Validate inputs
-        if not options or not correct_answer:
-            logger.error("Invalid question data: Missing options or correct answer")
-            default_options = ["Option A", "Option B", "Option C", "Option D"]
-            st.session_state[options_key] = default_options
-            st.session_state[correct_key] = "Option A"
-            return default_options, "Option A"
-        
-        # Clean and validate options
-        valid_options = [opt.strip() for opt in options if opt and opt.strip()]
-        if not valid_options:
-            logger.error("Invalid question data: No valid options")
-            default_options = ["Option A", "Option B", "Option C", "Option D"]
-            st.session_state[options_key] = default_options
-            st.session_state[correct_key] = "Option A"
-            return default_options, "Option A"
-        
-        # Ensure correct answer is in options
-        correct_answer = correct_answer.strip()
-        if correct_answer not in valid_options:
-            valid_options.append(correct_answer)
-        
-        # Shuffle options
-        random.shuffle(valid_options)
-        
-        # Store in session state
-        st.session_state[options_key] = valid_options
-        st.session_state[correct_key] = correct_answer
-        
-        return valid_options, correct_answer
-            
-    except Exception as e:
-        logger.error(f"Error in get_question_options: {str(e)}")
-        default_options = ["Option A", "Option B", "Option C", "Option D"]
-        st.session_state[options_key] = default_options
-        st.session_state[correct_key] = "Option A"
-        return default_options, "Option A"
+    if 'options' in q_state:
+        return q_state['options'], q_state['correct']
+
+    # Otherwise, create new randomized options. Every failure mode here is
+    # predictable, so each is handled with an explicit early return that
+    # logs and falls back to the defaults.
+    options = current_q.get('options')
+    correct_answer = current_q.get('correct_answer')
+    if not options or not correct_answer:
+        logger.error("Invalid question data: Missing options or correct answer")
+        return _store_options(q_state, list(DEFAULT_OPTIONS), DEFAULT_CORRECT)
+
+    # Clean and validate options in one pass (each option stripped once)
+    valid_options = [opt for opt in (raw.strip() for raw in options if raw) if opt]
+    if not valid_options:
+        logger.error("Invalid question data: No valid options")
+        return _store_options(q_state, list(DEFAULT_OPTIONS), DEFAULT_CORRECT)
+
+    # Ensure correct answer is in options
+    correct_answer = correct_answer.strip()
+    if correct_answer not in valid_options:
+        valid_options.append(correct_answer)
+
+    return _store_options(q_state, randomize_options(valid_options), correct_answer)
 
+@st.fragment
 def display_question(current_q: dict, question_num: int, total: int):
-    """Display question and handle user interaction."""
+    """Display question and handle user interaction.
+
+    Runs as a fragment: radio selections and the report expander rerun
+    only this panel instead of the whole script. Anything that changes
+    state rendered outside the panel (score, current question) escalates
+    to a full rerun via st.rerun(scope="app").
+    """
+    if not _REQUIRED_FIELDS.issubset(current_q):
+        logger.error(f"Question missing required fields: {current_q.keys()}")
+        st.error("An error occurred while displaying the question. Please try again.")
+        return
+
     try:
         # Create container for question content
         question_container = st.container()
@@ -79,49 +102,39 @@ def display_question(current_q: dict, question_num: int, total: int):
             
             # Get options (will be consistent due to session state)
             options, correct_answer = get_question_options(current_q, question_num)
-            
-            # Create unique keys for this question
+
+            # One namespaced dict holds this question's state for the render
+            q_state = get_question_state(question_num)
+
+            # Widget keys still need to be unique strings
             answer_key = f"answer_{question_num}"
-            check_key = f"check_{question_num}"
-            answered_key = f"answered_{question_num}"
-            
+
             # Only show options if question hasn't been answered
-            if not st.session_state.get(answered_key, False):
-                # Create columns for better layout
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
+            if not q_state.get('answered', False):
+                # The form holds the radio selection client-side, so changing
+                # it triggers no rerun at all; only the submit click does
+                with st.form(f"answer_form_{question_num}"):
                     user_answer = st.radio("Select your answer:", options, key=answer_key)
-                
-                with col2:
-                    # Center the check answer button
-                    st.write("")  # Add some spacing
-                    if st.button("Check Answer", key=check_key, use_container_width=True):
-                        st.session_state[answered_key] = True
-                        
+
+                    if st.form_submit_button("Check Answer", use_container_width=True):
                         # Process answer
                         is_correct = user_answer == current_q['correct_answer']
-                        
+
+                        q_state['answered'] = True
+                        q_state['user_answer'] = user_answer
+                        q_state['was_correct'] = is_correct
+
                         if is_correct:
-                            st.success("✅ Correct!")
                             st.session_state.score += 1
-                        else:
-                            st.error("❌ Incorrect!")
-                            st.warning(f"The correct answer is: {correct_answer}")
-                            
-                            # Show explanation if available
-                            if current_q.get('explanation'):
-                                with st.expander("See Explanation"):
-                                    st.info(current_q['explanation'])
-                        
-                        # Show next question button
-                        if st.button("Next Question", use_container_width=True):
-                            st.session_state.current_question += 1
-                            st.rerun()
+
+                        # The score metrics live outside this fragment, so
+                        # escalate to a full rerun; the answered branch below
+                        # renders the feedback on that pass
+                        st.rerun(scope="app")
             else:
                 # Show the selected answer and feedback when question is answered
-                st.info(f"Your answer: {st.session_state[answer_key]}")
-                if st.session_state.get(f"correct_{question_num}", False):
+                st.info(f"Your answer: {q_state.get('user_answer')}")
+                if q_state.get('was_correct', False):
                     st.success("✅ Correct!")
                 else:
                     st.error("❌ Incorrect!")
@@ -133,7 +146,7 @@ def display_question(current_q: dict, question_num: int, total: int):
                 # Show next question button
                 if st.button("Next Question", use_container_width=True):
                     st.session_state.current_question += 1
-                    st.rerun()
+                    st.rerun(scope="app")
             
             # Show report error button
             with st.expander("Report an Issue"):
@@ -142,8 +155,9 @@ def display_question(current_q: dict, question_num: int, total: int):
                 
                 if st.button("Submit Report", key=f"submit_report_{question_num}"):
                     try:
-                        with open('error_reports.log', 'a') as f:
-                            f.write(f"\n{'='*50}\nQuestion: {current_q['question']}\nReport: {error_report}\nEmail: {contact_email}\n")
+                        get_report_logger().info(
+                            f"\n{'='*50}\nQuestion: {current_q['question']}\nReport: {error_report}\nEmail: {contact_email}"
+                        )
                         st.success("Thank you for your feedback!")
                     except Exception as e:
                         st.error("Failed to submit report. Please try again.")
@@ -1,111 +1,182 @@
 """Quiz data loading and processing functionality."""
-import csv
+import os
+import pickle
+from operator import itemgetter
 from pathlib import Path
-import logging
 import unicodedata
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import re
 
+import pandas as pd
+
+from logging_setup import get_logger
+
 # Set up logging
-logging.basicConfig(
-    level=logging.ERROR,
-    filename='quiz_errors.log',
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
+
+# Multi-character mojibake sequences, longest-first so the bare '\u00e2\u20ac' prefix
+# only matches when no longer sequence does; compiled once at import
+_MOJIBAKE_FIXES = {
+    '\u00e2\u20ac\u2122': "'",
+    '\u00e2\u20ac"': "\u2013",
+    '\u00e2\u20ac\u0153': '"',
+    '\u00e2\u20ac': '"'
+}
+_MOJIBAKE_RE = re.compile('|'.join(re.escape(seq) for seq in _MOJIBAKE_FIXES))
+
+# Single-codepoint fixes applied in one C-level translate pass; only
+# codepoints that actually change are listed
+_CHAR_FIXES = str.maketrans({
+    '\u2019': "'",
+    '\u201c': '"',
+    '\u201d': '"'
+})
 
 def clean_text(text: Optional[str]) -> str:
     """Clean and validate text input."""
     if text is None:
         return ""
-    
+
     # Fix common encoding issues
     text = text.strip()
-    
-    # Replace problematic characters
-    replacements = {
-        'â€™': "'",
-        'â€"': "–",
-        'â€œ': '"',
-        'â€': '"',
-        '\u2019': "'",
-        '\u201c': '"',
-        '\u201d': '"',
-        '\u2013': "–",
-        '\u2014': "—"
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    
+
+    # Plain ASCII needs neither the mojibake fixes nor NFKC normalization,
+    # and it is the common case for this quiz bank
+    if text.isascii():
+        return text
+
+    # Replace problematic characters in two C-level passes; the mojibake
+    # regex only runs when its two-char marker is actually present
+    if '\u00e2\u20ac' in text:
+        text = _MOJIBAKE_RE.sub(lambda match: _MOJIBAKE_FIXES[match.group()], text)
+    text = text.translate(_CHAR_FIXES)
+
     # Normalize unicode characters
     text = unicodedata.normalize('NFKC', text)
-    
+
     return text
 
 def remove_duplicates_from_csv():
     """Remove duplicate questions from the quiz bank."""
+    # Maintenance-only path: keep the csv module off app startup
+    import csv
+
+    csv_path = "Minnesota_Driving_Quiz.csv"
+    tmp_path = csv_path + '.tmp'
+
     try:
-        # Read all questions
-        questions = []
-        seen_questions = set()
+        # Single pass: unique rows stream straight to a temp file instead of
+        # accumulating in memory; the temp file is swapped in (or discarded)
+        # once the pass is done
+        seen = set()
         duplicates_found = False
-        
-        with open("Minnesota_Driving_Quiz.csv", 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            headers = reader.fieldnames
-            
-            # First row is headers
-            questions.append(",".join(headers))
-            
+
+        # 1 MiB buffers: the whole bank moves in a couple of syscalls each
+        # way instead of the default 8 KiB chunks
+        with open(csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as infile, \
+                open(tmp_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as outfile:
+            reader = csv.reader(infile)
+            writer = csv.writer(outfile)
+
+            headers = next(reader)
+            question_idx = headers.index('Question')
+            writer.writerow(headers)
+
             for row in reader:
-                # Clean the question text
-                question = clean_text(row['Question']).lower().strip()
-                
-                # If we haven't seen this question before, add it
-                if question not in seen_questions:
-                    seen_questions.add(question)
-                    # Preserve the original format with quotes and commas
-                    row_values = [
-                        f'"{row["Question"]}"' if ',' in row["Question"] else row["Question"],
-                        row["Option A"],
-                        row["Option B"],
-                        row["Option C"],
-                        row["Option D"],
-                        row["Correct Answer"]
-                    ]
-                    questions.append(",".join(row_values))
-                else:
+                # Store 8-byte hashes rather than the full lowercased text;
+                # hash() is salted per process, which is fine within one run
+                key = hash(clean_text(row[question_idx]).lower().strip())
+                if key in seen:
                     duplicates_found = True
-                    print(f"Duplicate found: {row['Question']}")
-        
-        if duplicates_found:
-            # Write back the deduplicated questions
-            with open("Minnesota_Driving_Quiz.csv", 'w', encoding='utf-8', newline='') as file:
-                for line in questions:
-                    file.write(line + '\n')
-            
-            return True, "Duplicates removed successfully"
-        
-        return False, "No duplicates found"
-        
+                    print(f"Duplicate found: {row[question_idx]}")
+                else:
+                    seen.add(key)
+                    writer.writerow(row)
+
+        if not duplicates_found:
+            os.remove(tmp_path)
+            return False, "No duplicates found"
+
+        # Atomically replace the bank with the deduplicated version
+        os.replace(tmp_path, csv_path)
+        return True, "Duplicates removed successfully"
+
     except Exception as e:
         print(f"Error removing duplicates: {str(e)}")
         return False, f"Error: {str(e)}"
 
+# Parsed quiz bank, cached as (mtime_ns, data) so repeat loads skip the
+# parse entirely until the CSV actually changes
+_quiz_cache: Optional[Tuple[int, List[dict]]] = None
+
+def _load_baked(pkl_path: Path, csv_mtime: int) -> Optional[List[dict]]:
+    """Load the pre-parsed bank pickle if it is at least as new as the CSV."""
+    try:
+        if pkl_path.stat().st_mtime_ns >= csv_mtime:
+            with open(pkl_path, 'rb') as f:
+                return pickle.load(f) or None
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+    return None
+
+def _write_baked(pkl_path: Path, quiz_data: List[dict]) -> None:
+    """Persist the parsed bank next to the CSV for the next cold start."""
+    tmp_path = str(pkl_path) + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(quiz_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pkl_path)
+    except OSError as e:
+        # Best-effort: the bank still loaded fine from the CSV
+        logger.error(f"Could not write baked quiz bank: {str(e)}")
+
 def load_quiz_data() -> List[dict]:
     """Load quiz data from CSV and convert to proper format"""
+    global _quiz_cache
     quiz_data = []
     csv_path = Path("Minnesota_Driving_Quiz.csv")
-    
+
     try:
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
+        mtime = csv_path.stat().st_mtime_ns
+        if _quiz_cache is not None and _quiz_cache[0] == mtime:
+            # Shallow copy: callers shuffle the list in place
+            return list(_quiz_cache[1])
+
+        # A baked pickle sitting next to the CSV skips parsing and
+        # validation entirely on cold start; it is rebuilt below whenever
+        # the CSV is newer
+        pkl_path = csv_path.with_suffix('.pkl')
+        baked = _load_baked(pkl_path, mtime)
+        if baked is not None:
+            quiz_data = baked
+        else:
+            # pandas' C parser replaces the per-row DictReader loop; rows only
+            # become dicts once, right before validation. Rows with stray commas
+            # (unquoted "$25,000" style values) are skipped rather than aborting
+            # the whole load.
+            df = pd.read_csv(
+                csv_path,
+                dtype=str,
+                keep_default_na=False,
+                encoding='utf-8',
+                on_bad_lines='skip',
+                # Map the file instead of copying it into a read buffer
+                memory_map=True
+            )
+            # Deduplicate in the same pass: the first occurrence of a question
+            # wins, so the bank never needs a separate cleanup run to load clean
+            seen = set()
+            for row in df.to_dict('records'):
                 validated_question = validate_question(row)
                 if validated_question is not None:
+                    key = validated_question['question'].lower()
+                    if key in seen:
+                        continue
+                    seen.add(key)
                     quiz_data.append(validated_question)
-                
+            if quiz_data:
+                _write_baked(pkl_path, quiz_data)
+
     except Exception as e:
         logger.error(f"Error reading quiz data: {str(e)}")
         # Return default questions if loading fails
@@ -130,44 +201,42 @@ def load_quiz_data() -> List[dict]:
                 'explanation': 'The default speed limit in a residential area is 30 mph unless otherwise posted.'
             }
         ]
-    
-    return quiz_data
+
+    _quiz_cache = (mtime, quiz_data)
+    return list(quiz_data)
+
+_GET_OPTIONS = itemgetter('Option A', 'Option B', 'Option C', 'Option D')
 
 def validate_question(row: Dict[str, str]) -> Optional[Dict[str, Any]]:
     """Validate and clean question data."""
     try:
-        # Clean all text fields
+        # Clean all text fields; empty options fall out in the same pass and
+        # dict.fromkeys drops repeated options branchlessly, keeping order
         question = clean_text(row.get('Question'))
-        options = [
-            clean_text(row.get('Option A', '')),
-            clean_text(row.get('Option B', '')),
-            clean_text(row.get('Option C', '')),
-            clean_text(row.get('Option D', ''))
-        ]
+        options = list(dict.fromkeys(
+            opt for opt in map(clean_text, _GET_OPTIONS(row)) if opt
+        ))
         correct_answer = clean_text(row.get('Correct Answer', ''))
-        
-        # Filter out empty options
-        options = [opt for opt in options if opt]
-        
+
         # Validate required fields
         if not question:
             logger.error(f"Missing question text")
             return None
-            
+
         if not options or len(options) < 2:
             logger.error(f"Not enough valid options for question: {question}")
             return None
-            
+
         if not correct_answer:
             logger.error(f"Missing correct answer for question: {question}")
             return None
-            
+
         if correct_answer not in options:
             # Try to find the correct answer in the options (case-insensitive)
-            correct_answer_lower = correct_answer.lower()
-            matching_options = [opt for opt in options if opt.lower() == correct_answer_lower]
-            if matching_options:
-                correct_answer = matching_options[0]
+            options_ci = {opt.lower(): opt for opt in options}
+            matching_option = options_ci.get(correct_answer.lower())
+            if matching_option is not None:
+                correct_answer = matching_option
             else:
                 # Add correct answer to options if it's valid
                 if correct_answer.strip():
@@ -1,19 +1,71 @@
 """Quiz utilities and core functionality."""
 import streamlit as st
+import logging
 import random
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from typing import List, Dict, Any, Optional
 from datetime import datetime
-import os
-import csv
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
 import json
 from pathlib import Path
 
 from quiz_loader import load_quiz_data as load_csv_quiz_data
 
+# orjson encodes/decodes in C and is markedly faster than stdlib json for
+# the progress file; fall back to json when it isn't installed
+try:
+    import orjson
+
+    def _read_progress_file(path):
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def _write_progress_file(path, data):
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+except ImportError:
+    def _read_progress_file(path):
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _write_progress_file(path, data):
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+_report_logger = logging.getLogger('error_reports')
+
+def get_report_logger() -> logging.Logger:
+    """Return the shared logger for user-submitted error reports.
+
+    A single buffered FileHandler replaces re-opening error_reports.log in
+    append mode for every report; the file is only opened on first use.
+    """
+    if not _report_logger.handlers:
+        handler = logging.FileHandler('error_reports.log', delay=True)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        _report_logger.addHandler(handler)
+        _report_logger.setLevel(logging.INFO)
+        _report_logger.propagate = False
+    return _report_logger
+
+def get_session_rng() -> random.Random:
+    """Return this session's random generator.
+
+    A dedicated random.Random per session keeps shuffles independent of
+    other sessions sharing the process and avoids contending on the global
+    generator's state.
+    """
+    if 'rng' not in st.session_state:
+        st.session_state.rng = random.Random()
+    return st.session_state.rng
+
+@st.cache_data(persist="disk", show_spinner=False, max_entries=1)
 def load_quiz_data():
-    """Load quiz data from CSV file."""
+    """Load quiz data from CSV file.
+
+    Disk persistence keeps the parsed bank across process restarts, so a
+    cold start deserializes the cached list instead of re-running the CSV
+    parse and validation. Callers still copy before mutating.
+    """
     try:
         quiz_data = load_csv_quiz_data()
         if not quiz_data:
@@ -25,25 +77,84 @@ def load_quiz_data():
         return []
 
 def load_user_progress():
-    """Load user's question history and progress."""
+    """Load user's question history and progress.
+
+    The file is read once per session and cached in session_state;
+    handle_answer mutates the cached dict and marks it dirty, and
+    flush_user_progress writes it back at quiz boundaries.
+    """
+    if 'user_progress' in st.session_state:
+        return st.session_state.user_progress
+
     try:
         progress_file = Path("user_progress.json")
         if progress_file.exists():
-            with open(progress_file, 'r') as f:
-                return json.load(f)
-        return {'correct_questions': [], 'incorrect_questions': []}
+            saved = _read_progress_file(progress_file)
+        else:
+            saved = {}
     except Exception as e:
         st.error(f"Error loading progress: {str(e)}")
-        return {'correct_questions': [], 'incorrect_questions': []}
+        saved = {}
+
+    # Sets in memory for O(1) membership; converted back to lists on save
+    progress = {
+        'correct_questions': set(saved.get('correct_questions', [])),
+        'incorrect_questions': set(saved.get('incorrect_questions', []))
+    }
+    st.session_state.user_progress = progress
+    return progress
 
 def save_user_progress(progress):
     """Save user's question history and progress."""
     try:
-        with open("user_progress.json", 'w') as f:
-            json.dump(progress, f)
+        # The in-memory sets serialize as sorted lists for stable files
+        _write_progress_file(
+            "user_progress.json",
+            {key: sorted(values) for key, values in progress.items()}
+        )
     except Exception as e:
         st.error(f"Error saving progress: {str(e)}")
 
+def flush_user_progress():
+    """Write the cached progress to disk if it has unsaved changes."""
+    if st.session_state.get('progress_dirty'):
+        save_user_progress(st.session_state.user_progress)
+        st.session_state.progress_dirty = False
+
+def prepare_question_options(questions: List[Dict[str, Any]]) -> None:
+    """Shuffle every question's options in one batch at load time.
+
+    Doing all the shuffles up front keeps the per-question render path free
+    of RNG work: display code just reads the precomputed order out of
+    q_state.
+    """
+    rng = get_session_rng()
+    # A plain list parallel to the questions: O(1) integer indexing, one
+    # session entry, and restart cleanup is just rebuilding the list
+    q_state = []
+    for question in questions:
+        # Strip each option once; the generator feeds the filter so no
+        # intermediate list is built and no option is stripped twice
+        options = [opt for opt in (raw.strip() for raw in question['options'] if raw) if opt]
+        correct_answer = question['correct_answer'].strip()
+        if correct_answer not in options:
+            options.append(correct_answer)
+        q_state.append({
+            'options': rng.sample(options, len(options)),
+            'correct': correct_answer
+        })
+    st.session_state.q_state = q_state
+
+def mark_answered_correctly(question_num: int) -> None:
+    """Record a correctly answered question index in the session bitmap."""
+    st.session_state.answered_correctly = (
+        st.session_state.get('answered_correctly', 0) | (1 << question_num)
+    )
+
+def was_answered_correctly(question_num: int) -> bool:
+    """Check the session bitmap for a correctly answered question index."""
+    return bool((st.session_state.get('answered_correctly', 0) >> question_num) & 1)
+
 def initialize_quiz_state():
     """Initialize or reset quiz state."""
     if 'current_question' not in st.session_state:
@@ -53,18 +164,21 @@ def initialize_quiz_state():
         st.session_state.score = 0
     
     if 'questions' not in st.session_state:
-        questions = load_quiz_data()
+        # Copy: the cached bank is shared across sessions by reference
+        questions = list(load_quiz_data())
         if questions:
             st.session_state.questions = questions
             # Shuffle questions for variety
-            random.shuffle(st.session_state.questions)
+            get_session_rng().shuffle(st.session_state.questions)
+            prepare_question_options(st.session_state.questions)
         else:
             st.error("Failed to load quiz questions. Please check the quiz data file.")
             st.session_state.questions = []
 
 def get_current_question():
     """Get the current question based on quiz state."""
-    if not hasattr(st.session_state, 'questions') or not st.session_state.questions:
+    # Dict-level membership test instead of hasattr's attribute machinery
+    if not st.session_state.get('questions'):
         return None
     
     if st.session_state.current_question >= len(st.session_state.questions):
@@ -75,17 +189,20 @@ def get_current_question():
 def handle_answer(question_data: Dict[str, Any], user_answer: str):
     """Process user's answer and update progress."""
     progress = load_user_progress()
+
+    question = question_data['question']
     correct = user_answer == question_data['correct_answer']
-    
+
+    # The progress entries are sets, so recording an answer is a plain add
     if correct:
         st.session_state.score += 1
-        if question_data['question'] not in progress['correct_questions']:
-            progress['correct_questions'].append(question_data['question'])
+        progress['correct_questions'].add(question)
     else:
-        if question_data['question'] not in progress['incorrect_questions']:
-            progress['incorrect_questions'].append(question_data['question'])
-    
-    save_user_progress(progress)
+        progress['incorrect_questions'].add(question)
+
+    # Defer the disk write: the cached progress is flushed at quiz
+    # boundaries instead of once per answered question
+    st.session_state.progress_dirty = True
     st.session_state.current_question += 1
     return correct
 
@@ -111,28 +228,30 @@ def get_quiz_summary():
 
 def reset_quiz():
     """Reset quiz state for a new attempt."""
+    flush_user_progress()
     if 'questions' in st.session_state:
-        random.shuffle(st.session_state.questions)
+        get_session_rng().shuffle(st.session_state.questions)
+        prepare_question_options(st.session_state.questions)
     st.session_state.current_question = 0
     st.session_state.score = 0
 
 def send_error_report(question_data: dict, user_report: str, contact_email: str = None):
     """Send error report via email using Gmail SMTP."""
     try:
-        # Create report content
-        report_content = f"""
-        Question: {question_data['question']}
-        Options: {', '.join(question_data['options'])}
-        Correct Answer: {question_data['correct_answer']}
-        User Report: {user_report}
-        Contact Email: {contact_email if contact_email else 'Not provided'}
-        Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """
-        
+        # Build the report as small segments; they are joined once when the
+        # handler emits the record rather than through a nested f-string
+        report_lines = (
+            f"Question: {question_data['question']}",
+            f"Options: {', '.join(question_data['options'])}",
+            f"Correct Answer: {question_data['correct_answer']}",
+            f"User Report: {user_report}",
+            f"Contact Email: {contact_email if contact_email else 'Not provided'}",
+            f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+
         # Log the error report
-        with open('error_reports.log', 'a') as f:
-            f.write(f"\n{'='*50}\n{report_content}\n")
-            
+        get_report_logger().info("\n%s\n%s", '=' * 50, '\n'.join(report_lines))
+
         return True
     except Exception as e:
         st.error(f"Error saving report: {str(e)}")
@@ -142,14 +261,28 @@ def display_score(total_questions, min_correct):
     current_score = st.session_state.score
     questions_remaining = total_questions - st.session_state.current_question
     max_possible_score = current_score + questions_remaining
-    
+
+    # The metric strings only change when the score does, so format them
+    # once per score change instead of on every rerun
+    cache_key = (current_score, total_questions, min_correct)
+    if st.session_state.get('score_strings_key') != cache_key:
+        # Computed once per score change, zero-guarded
+        percentage = (current_score * 100 / total_questions) if total_questions else 0.0
+        st.session_state.score_strings_key = cache_key
+        st.session_state.score_strings = (
+            f"{current_score}/{total_questions}",
+            f"{min_correct}/{total_questions}",
+            f"{percentage:.1f}%"
+        )
+    score_str, required_str, percentage_str = st.session_state.score_strings
+
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Current Score", f"{current_score}/{total_questions}")
+        st.metric("Current Score", score_str)
     with col2:
-        st.metric("Required to Pass", f"{min_correct}/{total_questions}")
+        st.metric("Required to Pass", required_str)
     with col3:
-        st.metric("Current Percentage", f"{(current_score/total_questions*100):.1f}%")
+        st.metric("Current Percentage", percentage_str)
         
     if max_possible_score < min_correct:
         st.warning("⚠️ Cannot achieve passing score of 80%")
@@ -157,8 +290,9 @@ def display_score(total_questions, min_correct):
         st.success("🎉 Passing score achieved!")
 
 def handle_quiz_end(total_questions, min_correct, pass_percentage):
+    flush_user_progress()
     score = st.session_state.score
-    percentage = (score/total_questions*100)
+    percentage = (score * 100 / total_questions) if total_questions else 0.0
     passed = score >= min_correct
     
     if passed:
@@ -166,16 +300,23 @@ def handle_quiz_end(total_questions, min_correct, pass_percentage):
     else:
         st.error(f"❌ Quiz failed. Score: {score}/{total_questions} ({percentage:.1f}%). Required: {pass_percentage}%")
     
+    # Read these once; session_state's proxy __getitem__ is not free inside
+    # the review loops below
+    bookmarked_questions = st.session_state.get('bookmarked_questions')
+    questions = st.session_state.questions
+
     # Show bookmarked questions first
-    if hasattr(st.session_state, 'bookmarked_questions') and st.session_state.bookmarked_questions:
+    if bookmarked_questions:
         st.subheader("📑 Bookmarked Questions")
-        for q_num in st.session_state.bookmarked_questions:
-            question = st.session_state.questions[q_num]
+        question_states = st.session_state.get('q_state', [])
+        for q_num in bookmarked_questions:
+            question = questions[q_num]
+            q_state = question_states[q_num] if q_num < len(question_states) else {}
             with st.expander(f"Question {q_num + 1}: {question['question']}", expanded=False):
                 col1, col2 = st.columns(2)
                 with col1:
-                    if f'answered_{q_num}' in st.session_state and st.session_state[f'answered_{q_num}']:
-                        st.write("Your Answer:", st.session_state[f'user_answer_{q_num}'])
+                    if q_state.get('answered'):
+                        st.write("Your Answer:", q_state.get('user_answer'))
                     st.write("Correct Answer:", question['correct_answer'])
                 with col2:
                     st.write("Topic:", question['topic'])
@@ -186,9 +327,10 @@ def handle_quiz_end(total_questions, min_correct, pass_percentage):
                 st.info(f"📚 Study Tip: Review the section on {question['topic']} in the Minnesota Driver's Manual.")
     
     # Then show incorrect answers
-    if st.session_state.incorrect_questions:
+    incorrect_questions = st.session_state.incorrect_questions
+    if incorrect_questions:
         st.subheader("❌ Review Incorrect Answers")
-        for idx, question in enumerate(st.session_state.incorrect_questions):
+        for idx, question in enumerate(incorrect_questions):
             with st.expander(f"Question {idx + 1}: {question['question']}", expanded=False):
                 col1, col2 = st.columns(2)
                 with col1:
@@ -203,16 +345,16 @@ def handle_quiz_end(total_questions, min_correct, pass_percentage):
                 st.info(f"📚 Study Tip: Review the section on {question['topic']} in the Minnesota Driver's Manual.")
     
     # Add practice mode option for bookmarked questions
-    if hasattr(st.session_state, 'bookmarked_questions') and st.session_state.bookmarked_questions:
+    if bookmarked_questions:
         if st.button("Practice Bookmarked Questions"):
             # Create a new quiz with only bookmarked questions
             st.session_state.practice_mode = True
             st.session_state.practice_questions = [
-                st.session_state.questions[q_num] for q_num in st.session_state.bookmarked_questions
+                questions[q_num] for q_num in bookmarked_questions
             ]
             st.session_state.current_question = 0
             st.session_state.score = 0
-            st.session_state.answered_correctly = set()
+            st.session_state.answered_correctly = 0
             st.session_state.incorrect_questions = []
             st.rerun()
     
@@ -220,12 +362,18 @@ def handle_quiz_end(total_questions, min_correct, pass_percentage):
     if st.button("Restart Quiz"):
         st.session_state.current_question = 0
         st.session_state.score = 0
-        st.session_state.answered_correctly = set()
+        st.session_state.answered_correctly = 0
         st.session_state.incorrect_questions = []
         st.session_state.practice_mode = False
         st.rerun()
 
+# Oldest attempts fall off automatically so a long-lived tab can't grow
+# session state without bound
+_HISTORY_LIMIT = 50
+
 def save_score(score, total_questions):
+    if 'history' not in st.session_state:
+        st.session_state.history = deque(maxlen=_HISTORY_LIMIT)
     st.session_state.history.append({
         'score': score,
         'total_questions': total_questions,
@@ -233,20 +381,26 @@ def save_score(score, total_questions):
     })
 
 def display_history():
-    if st.session_state.history:
+    history = st.session_state.get('history')
+    if history:
         st.sidebar.subheader("Quiz History")
-        for idx, entry in enumerate(st.session_state.history):
-            st.sidebar.write(f"Quiz {idx + 1}: {entry['score']}/{entry['total_questions']} ({entry['percentage']:.1f}%)")
+        # Most recent first; reversed() walks the deque without copying it
+        for idx, entry in zip(range(len(history), 0, -1), reversed(history)):
+            st.sidebar.write(f"Quiz {idx}: {entry['score']}/{entry['total_questions']} ({entry['percentage']:.1f}%)")
 
 def start_new_quiz(quiz_data, total_questions):
-    selected_questions = random.sample(quiz_data, total_questions)
+    flush_user_progress()
+    selected_questions = get_session_rng().sample(quiz_data, total_questions)
     st.session_state.questions = selected_questions
+    # Text -> index map so progress/bookmark lookups by question text are
+    # O(1) instead of scanning the selection
+    st.session_state.question_index = {
+        question['question']: idx for idx, question in enumerate(selected_questions)
+    }
     st.session_state.score = 0
     st.session_state.current_question = 0
-    st.session_state.answered_correctly = set()
+    st.session_state.answered_correctly = 0
     st.session_state.incorrect_questions = []
     
-    # Clear previous question options
-    for key in list(st.session_state.keys()):
-        if key.startswith('options_') or key.startswith('correct_'):
-            del st.session_state[key]
\ No newline at end of file
+    # Replaces all previous per-question state in one batch
+    prepare_question_options(selected_questions)
\ No newline at end of file
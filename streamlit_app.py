@@ -8,6 +8,33 @@ from quiz_utils import (
 )
 from question_display import display_question
 
+# Built once at import; note the st.markdown call itself must run on every
+# rerun — Streamlit drops elements that are not re-emitted, so gating the
+# injection behind a session flag would lose the styling after one rerun
+_CUSTOM_CSS = """
+    <style>
+    .stProgress > div > div > div > div {
+        background-color: #4CAF50;
+    }
+    .stButton>button {
+        background-color: #4CAF50;
+        color: white;
+        border-radius: 5px;
+        border: none;
+        padding: 10px 24px;
+    }
+    .stButton>button:hover {
+        background-color: #45a049;
+    }
+    .reportform {
+        background-color: #f8f9fa;
+        padding: 20px;
+        border-radius: 10px;
+        margin: 10px 0;
+    }
+    </style>
+"""
+
 def main():
     # Set page config
     st.set_page_config(
@@ -17,29 +44,7 @@ def main():
     )
     
     # Add custom CSS
-    st.markdown("""
-        <style>
-        .stProgress > div > div > div > div {
-            background-color: #4CAF50;
-        }
-        .stButton>button {
-            background-color: #4CAF50;
-            color: white;
-            border-radius: 5px;
-            border: none;
-            padding: 10px 24px;
-        }
-        .stButton>button:hover {
-            background-color: #45a049;
-        }
-        .reportform {
-            background-color: #f8f9fa;
-            padding: 20px;
-            border-radius: 10px;
-            margin: 10px 0;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
     
     # Main title with emoji
     st.title("🚗 Minnesota Driver's License Quiz")
@@ -49,7 +54,7 @@ def main():
     
     # Load progress
     progress = load_user_progress()
-    total_questions = len(st.session_state.questions) if hasattr(st.session_state, 'questions') else 0
+    total_questions = len(st.session_state.get('questions', ()))
     
     # Safety check for total_questions
     if total_questions == 0:
@@ -62,24 +67,38 @@ def main():
     # Initialize current_question if not present
     if 'current_question' not in st.session_state:
         st.session_state.current_question = 0
-    
+
+    # Read the hot session values once per rerun
+    score = st.session_state.score
+    question_num = st.session_state.current_question
     answered_correctly = len(progress['correct_questions']) if progress else 0
-    
+
     # Create a container for metrics
     with st.container():
+        # Format the metric strings only when the underlying numbers move;
+        # identical strings also let Streamlit's element diff short-circuit
+        metrics_key = (score, answered_correctly, total_questions)
+        if st.session_state.get('metrics_key') != metrics_key:
+            st.session_state.metrics_key = metrics_key
+            st.session_state.metrics_strings = (
+                f"{score}/{total_questions}",
+                f"{answered_correctly}/{total_questions}",
+                str(total_questions - answered_correctly)
+            )
+        score_str, mastered_str, remaining_str = st.session_state.metrics_strings
+
         # Display progress metrics in columns
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Current Score", f"{st.session_state.score}/{total_questions}")
+            st.metric("Current Score", score_str)
         with col2:
-            st.metric("Questions Mastered", f"{answered_correctly}/{total_questions}")
+            st.metric("Questions Mastered", mastered_str)
         with col3:
-            remaining = total_questions - answered_correctly
-            st.metric("Questions Remaining", str(remaining))
+            st.metric("Questions Remaining", remaining_str)
         
-        # Display progress bar with safety checks
-        progress_percentage = min((st.session_state.current_question / total_questions) * 100, 100) if total_questions > 0 else 0
-        st.progress(progress_percentage / 100)
+        # Progress bar takes a 0..1 fraction directly; total_questions is
+        # known non-zero by the guard above
+        st.progress(min(question_num / total_questions, 1.0))
     
     # Create main content container
     main_container = st.container()
@@ -88,14 +107,14 @@ def main():
         # Get and display current question
         current_question = get_current_question()
         if current_question:
-            display_question(current_question, st.session_state.current_question, total_questions)
+            display_question(current_question, question_num, total_questions)
         else:
             # Quiz completion screen
             st.success("🎉 Congratulations! You've completed the quiz!")
             st.balloons()
             
             # Show final score and stats
-            final_score = st.session_state.score
+            final_score = score
             score_percentage = (final_score / total_questions) * 100
             
             st.markdown(f"""